@@ -0,0 +1,219 @@
+"""Tests for latency-aware model selection and hedged TTS requests."""
+
+import asyncio
+
+import httpx
+import pytest
+
+import elevenlabs_mcp as server
+
+
+@pytest.fixture(autouse=True)
+def fresh_latencies(monkeypatch):
+    """Give each test an empty latency window."""
+    monkeypatch.setattr(server, "_model_latencies", {})
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url=server.BASE_URL, transport=httpx.MockTransport(handler))
+
+
+def _payload(text: str = "Build failed") -> dict:
+    return {"text": text, "model_id": server.DEFAULT_MODEL_ID, "output_format": "mp3_44100_128"}
+
+
+# ============================================================================
+# MODEL SELECTION
+# ============================================================================
+
+def test_select_model_keeps_default_without_budget():
+    assert server._select_model("short", None, None) == server.DEFAULT_MODEL_ID
+
+
+def test_select_model_routes_short_urgent_text_to_turbo():
+    assert server._select_model("short", None, 1000) == server.LOW_LATENCY_MODEL_ID
+
+
+def test_select_model_keeps_default_for_long_text():
+    long_text = "x" * (server.SHORT_TEXT_MAX_CHARS + 1)
+    assert server._select_model(long_text, None, 1000) == server.DEFAULT_MODEL_ID
+
+
+def test_select_model_respects_explicit_model():
+    assert server._select_model("short", "eleven_multilingual_v2", 1000) == "eleven_multilingual_v2"
+
+
+def test_select_model_routes_when_default_misses_relaxed_budget():
+    assert server._select_model("short", None, 4000) == server.DEFAULT_MODEL_ID
+
+    for _ in range(server.LATENCY_MIN_SAMPLES):
+        server._record_latency(server.DEFAULT_MODEL_ID, len("short"), 5.0)
+
+    assert server._select_model("short", None, 4000) == server.LOW_LATENCY_MODEL_ID
+
+
+def test_select_model_ignores_long_text_latencies_for_short_text():
+    for _ in range(server.LATENCY_MIN_SAMPLES):
+        server._record_latency(server.DEFAULT_MODEL_ID, 5000, 5.0)
+
+    assert server._select_model("short", None, 4000) == server.DEFAULT_MODEL_ID
+
+
+# ============================================================================
+# LATENCY PERCENTILE
+# ============================================================================
+
+def test_percentile_requires_min_samples():
+    for _ in range(server.LATENCY_MIN_SAMPLES - 1):
+        server._record_latency("m", 10, 1.0)
+    assert server._latency_percentile("m", 10) is None
+
+    server._record_latency("m", 10, 1.0)
+    assert server._latency_percentile("m", 10) == 1.0
+
+
+def test_percentile_picks_p95_of_window():
+    for ms in range(1, 101):
+        server._record_latency("m", 10, ms / 1000)
+
+    # Only the last LATENCY_WINDOW_SIZE samples are kept
+    window = [ms / 1000 for ms in range(101 - server.LATENCY_WINDOW_SIZE, 101)]
+    expected = window[round(0.95 * (len(window) - 1))]
+    assert server._latency_percentile("m", 10) == expected
+
+
+def test_percentile_ignores_expired_samples(monkeypatch):
+    for _ in range(server.LATENCY_MIN_SAMPLES):
+        server._record_latency("m", 10, 1.0)
+
+    later = server.time.monotonic() + server.LATENCY_SAMPLE_TTL_S + 1
+    monkeypatch.setattr(server.time, "monotonic", lambda: later)
+    assert server._latency_percentile("m", 10) is None
+
+
+# ============================================================================
+# HEDGED REQUESTS
+# ============================================================================
+
+def test_hedge_not_fired_for_fast_primary():
+    async def handler(request):
+        return httpx.Response(200, content=b"audio")
+
+    async def run():
+        async with _client(handler) as client:
+            return await server._post_tts_hedged(client, "voice", _payload(), hedge_after=1.0)
+
+    response, hedged = asyncio.run(run())
+    assert response.content == b"audio"
+    assert hedged is False
+
+
+def test_hedge_wins_and_slow_primary_is_cancelled_and_recorded():
+    delays = [1.0, 0.05]
+    cancelled = []
+
+    async def handler(request):
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return httpx.Response(200, content=f"{delay}".encode())
+
+    async def run():
+        async with _client(handler) as client:
+            return await server._post_tts_hedged(client, "voice", _payload(), hedge_after=0.1)
+
+    response, hedged = asyncio.run(run())
+    assert hedged is True
+    assert response.content == b"0.05"
+    assert cancelled == [1.0]
+
+    # The cancelled primary is recorded as a lower bound next to the winner
+    samples = sorted(s for _, s in server._model_latencies[(server.DEFAULT_MODEL_ID, "short")])
+    assert len(samples) == 2
+    assert samples[1] >= 0.1
+
+
+def test_primary_winning_after_hedge_records_no_sub_threshold_sample():
+    delays = [0.3, 2.0]
+    cancelled = []
+
+    async def handler(request):
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return httpx.Response(200, content=f"{delay}".encode())
+
+    async def run():
+        async with _client(handler) as client:
+            return await server._post_tts_hedged(client, "voice", _payload(), hedge_after=0.25)
+
+    response, hedged = asyncio.run(run())
+    assert hedged is True
+    assert response.content == b"0.3"
+    assert cancelled == [2.0]
+
+    # Only the primary is recorded; the cancelled hedge contributes nothing
+    samples = [s for _, s in server._model_latencies[(server.DEFAULT_MODEL_ID, "short")]]
+    assert len(samples) == 1
+    assert all(sample >= 0.25 for sample in samples)
+
+
+def test_caller_cancellation_cancels_primary_without_recording():
+    cancelled = []
+
+    async def handler(request):
+        try:
+            await asyncio.sleep(5.0)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return httpx.Response(200)
+
+    async def run():
+        async with _client(handler) as client:
+            call = asyncio.create_task(server._post_tts_hedged(client, "voice", _payload(), hedge_after=1.0))
+            await asyncio.sleep(0.05)
+            call.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await call
+
+    asyncio.run(run())
+    assert cancelled == [True]
+    assert (server.DEFAULT_MODEL_ID, "short") not in server._model_latencies
+
+
+@pytest.mark.parametrize("status", [401, 404, 422])
+def test_client_errors_are_not_recorded(status):
+    async def handler(request):
+        return httpx.Response(status)
+
+    async def run():
+        async with _client(handler) as client:
+            return await server._post_tts(client, "voice", _payload())
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+
+    assert (server.DEFAULT_MODEL_ID, "short") not in server._model_latencies
+
+
+def test_hedge_raises_when_both_requests_fail():
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(500)
+
+    async def run():
+        async with _client(handler) as client:
+            return await server._post_tts_hedged(client, "voice", _payload(), hedge_after=0.01)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+
+    # Failed requests still count towards the latency window
+    assert len(server._model_latencies[(server.DEFAULT_MODEL_ID, "short")]) == 2
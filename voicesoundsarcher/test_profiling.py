@@ -0,0 +1,140 @@
+"""Tests for opt-in per-call profiling."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import elevenlabs_mcp as server
+
+
+@pytest.fixture(autouse=True)
+def profiling_state(monkeypatch, tmp_path):
+    """Give each test disabled profiling that writes under tmp_path."""
+    state = {
+        "enabled": False,
+        "output_dir": str(tmp_path / "profiles"),
+        "max_calls": 3,
+        "active_task": None,
+        "overlaps": set(),
+        "running": set()
+    }
+    monkeypatch.setattr(server, "_profiling_state", state)
+    return state
+
+
+@server._profiled
+async def sample_tool(delay: float = 0.0) -> str:
+    await asyncio.sleep(delay)
+    return "done"
+
+
+@server._profiled
+async def outer_tool() -> str:
+    return await sample_tool()
+
+
+def _artifacts(state) -> list[str]:
+    output_dir = Path(state["output_dir"])
+    return sorted(p.name for p in output_dir.iterdir()) if output_dir.exists() else []
+
+
+def test_disabled_writes_nothing(profiling_state):
+    assert asyncio.run(sample_tool()) == "done"
+    assert _artifacts(profiling_state) == []
+
+
+def test_enabled_writes_pstats_and_allocation_summary(profiling_state):
+    profiling_state["enabled"] = True
+
+    assert asyncio.run(sample_tool()) == "done"
+
+    names = _artifacts(profiling_state)
+    assert len(names) == 2
+    assert names[0].endswith("_sample_tool.alloc.txt")
+    assert names[1].endswith("_sample_tool.pstats")
+
+    summary = (Path(profiling_state["output_dir"]) / names[0]).read_text(encoding="utf-8")
+    assert "tool: sample_tool" in summary
+    assert "overlapping_calls: 0" in summary
+
+
+def test_nested_calls_share_one_profile(profiling_state):
+    profiling_state["enabled"] = True
+
+    asyncio.run(outer_tool())
+
+    names = _artifacts(profiling_state)
+    assert [n for n in names if n.endswith(".pstats")][0].endswith("_outer_tool.pstats")
+    assert len(names) == 2
+
+
+def test_concurrent_calls_are_reported_as_overlapping(profiling_state):
+    profiling_state["enabled"] = True
+
+    async def run():
+        await asyncio.gather(sample_tool(0.05), sample_tool(0.01), sample_tool(0.01))
+
+    asyncio.run(run())
+
+    output_dir = Path(profiling_state["output_dir"])
+    summaries = list(output_dir.glob("*.alloc.txt"))
+    assert len(summaries) == 1
+    assert "overlapping_calls: 2" in summaries[0].read_text(encoding="utf-8")
+    assert profiling_state["running"] == set()
+
+
+def test_retention_keeps_max_calls(profiling_state):
+    profiling_state["enabled"] = True
+
+    for _ in range(profiling_state["max_calls"] + 2):
+        asyncio.run(sample_tool())
+
+    output_dir = Path(profiling_state["output_dir"])
+    assert len(list(output_dir.glob("*.pstats"))) == profiling_state["max_calls"]
+    assert len(list(output_dir.glob("*.alloc.txt"))) == profiling_state["max_calls"]
+
+
+def test_retention_ignores_foreign_files(profiling_state):
+    profiling_state["enabled"] = True
+    output_dir = Path(profiling_state["output_dir"])
+    output_dir.mkdir(parents=True)
+    (output_dir / "aaa_important.pstats").write_bytes(b"keep")
+
+    for _ in range(profiling_state["max_calls"] + 1):
+        asyncio.run(sample_tool())
+
+    assert (output_dir / "aaa_important.pstats").exists()
+    assert len(list(output_dir.glob("*_sample_tool.pstats"))) == profiling_state["max_calls"]
+
+
+def test_configure_profiling_toggles_state(profiling_state, tmp_path):
+    params = server.ConfigureProfilingInput(enabled=True, output_dir=str(tmp_path / "custom"), max_calls=7)
+
+    result = asyncio.run(server.configure_profiling(params))
+
+    assert "enabled" in result
+    assert profiling_state["enabled"] is True
+    assert profiling_state["output_dir"] == str(tmp_path / "custom")
+    assert profiling_state["max_calls"] == 7
+
+    asyncio.run(server.configure_profiling(server.ConfigureProfilingInput(enabled=False)))
+    assert profiling_state["enabled"] is False
+    assert profiling_state["max_calls"] == 7
+
+
+@pytest.mark.parametrize("value, expected", [("ten", 50), ("0", 1), ("-5", 1), ("12", 12)])
+def test_max_calls_env_is_parsed_defensively(value, expected):
+    env = dict(os.environ, ELEVENLABS_PROFILE_MAX_CALLS=value)
+    result = subprocess.run(
+        [sys.executable, "-c", "import elevenlabs_mcp; print(elevenlabs_mcp.PROFILE_MAX_CALLS)"],
+        cwd=Path(server.__file__).resolve().parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    assert int(result.stdout.strip()) == expected
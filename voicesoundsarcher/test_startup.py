@@ -0,0 +1,10 @@
+"""Startup budget regression test."""
+
+import elevenlabs_mcp as server
+
+
+def test_startup_self_time_within_budget(capsys):
+    exit_code = server._profile_startup(server.STARTUP_BUDGET_MS)
+    report = capsys.readouterr().out
+    assert exit_code == 0, report
+    assert "elevenlabs_mcp self time" in report